@@ -8,86 +8,319 @@ predefined source file at regular intervals.
 
 import os
 import time
+import queue
+import atexit
+import types
 import random
+import string
+import asyncio
+import functools
 import logging
-import schedule
-from typing import List, Optional
+import threading
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Awaitable, Callable, List, Mapping, Optional, Tuple, TypeVar
+import requests
 import tweepy
-from openai import OpenAI
+from diskcache import Cache
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("twitter_agent.log"),
-        logging.StreamHandler()
-    ]
-)
+try:
+    import orjson
+except ImportError:  # Optional; requests falls back to the stdlib json module
+    orjson = None
+
+# Configure logging; file and console writes happen on a background listener thread
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler("twitter_agent.log"),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
 
+
+def _use_orjson_for_requests() -> None:
+    """Route the JSON encoding and decoding requests does for Tweepy through orjson.
+    
+    Only requests.models is patched, leaving the global json module untouched.
+    Skipped when orjson is missing or requests has been built on simplejson,
+    whose JSONDecodeError orjson's error does not subclass.
+    """
+    if orjson is None or getattr(requests.compat, "has_simplejson", False):
+        return
+    if not hasattr(requests.models, "complexjson"):
+        return
+    
+    requests.models.complexjson = types.SimpleNamespace(
+        # prepare_body only encodes str results, so orjson's bytes are used directly
+        dumps=lambda obj, **kwargs: orjson.dumps(obj),
+        loads=lambda s, **kwargs: orjson.loads(s),
+        JSONDecodeError=orjson.JSONDecodeError
+    )
+
+
+_use_orjson_for_requests()
+
+# Environment variables that must be set for the Twitter API clients
+REQUIRED_CREDENTIALS = (
+    "TWITTER_API_KEY",
+    "TWITTER_API_SECRET",
+    "TWITTER_ACCESS_TOKEN",
+    "TWITTER_ACCESS_TOKEN_SECRET",
+    "TWITTER_BEARER_TOKEN",
+)
+
+# Rate limit wait when Twitter does not report a reset time (one 15-minute window)
+DEFAULT_RATE_LIMIT_WAIT_SECONDS = 15 * 60
+
+# How long a pre-generated AI tweet stays in the on-disk cache
+AI_CACHE_EXPIRE_SECONDS = 86400
+
+# Twitter's limit on the weighted length of a tweet
+MAX_TWEET_LENGTH = 280
+
+# Code point ranges Twitter counts as weight 1; everything else counts as 2
+_LIGHT_CHAR_RANGES = ((0x0000, 0x10FF), (0x2000, 0x200D), (0x2010, 0x201F), (0x2032, 0x2037))
+
+# Default context about CryptoXpress
+CRYPTOXPRESS_CONTEXT = """
+CryptoXpress is a cryptocurrency platform offering:
+- Simplified crypto trading
+- Decentralized finance (DeFi) solutions
+- NFT marketplace
+- Payment solutions
+- Banking services
+- Aims to make crypto accessible to regular users
+- Available on web and mobile
+- Focus on security and ease of use
+- Website: https://www.cryptoxpress.com/
+"""
+
+# Prompt templates for AI tweets; only $topic_prompt varies per call
+AI_SYSTEM_PROMPT = string.Template(
+    "You are a marketing expert for a cryptocurrency platform called CryptoXpress. "
+    "Generate ONE short, engaging tweet $topic_prompt. The tweet must be under 280 characters, "
+    "include relevant hashtags, and be written in a professional yet approachable tone. "
+    "Do not use excessive emojis or hype language. Include the URL https://www.cryptoxpress.com/ "
+    "only if it fits naturally. Context: " + CRYPTOXPRESS_CONTEXT
+)
+AI_USER_PROMPT = string.Template("Write a single marketing tweet $topic_prompt. Must be under 280 characters.")
+
+
+def _char_weight(char: str) -> int:
+    """Return the weight Twitter assigns to a single character."""
+    code = ord(char)
+    for low, high in _LIGHT_CHAR_RANGES:
+        if low <= code <= high:
+            return 1
+    return 2
+
+
+def _fit_tweet_length(text: str) -> str:
+    """Truncate text with an ellipsis so its weighted length fits in a tweet."""
+    # No character weighs more than 2, so short text can skip the weighted count
+    if len(text) * 2 <= MAX_TWEET_LENGTH:
+        return text
+    
+    weights = [_char_weight(c) for c in text]
+    if sum(weights) <= MAX_TWEET_LENGTH:
+        return text
+    
+    budget = MAX_TWEET_LENGTH - 3
+    for i, weight in enumerate(weights):
+        budget -= weight
+        if budget < 0:
+            return text[:i] + "..."
+    return text
+
+
+_T = TypeVar("_T")
+
+
+async def _run_in_daemon_thread(func: Callable[..., _T], *args: Any) -> _T:
+    """Run a blocking call in a daemon thread and await its result.
+    
+    Unlike asyncio.to_thread, nothing joins the thread on shutdown, so Ctrl+C
+    stops the agent at once instead of waiting for an in-flight API call. The
+    trade-off is that a call abandoned this way may or may not have reached
+    Twitter or OpenAI before the process exited.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(result: Any, error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def worker() -> None:
+        result, error = None, None
+        try:
+            result = func(*args)
+        except BaseException as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            # The event loop already closed because the agent was stopped
+            pass
+    
+    threading.Thread(target=worker, daemon=True).start()
+    return await future
+
+
+def _rate_limit_wait(error: tweepy.errors.TooManyRequests) -> float:
+    """Return the seconds until the rate limit window in a 429 response resets."""
+    reset = error.response.headers.get("x-rate-limit-reset")
+    if reset is None:
+        return DEFAULT_RATE_LIMIT_WAIT_SECONDS
+    # One extra second so the retry lands after the reset, not on it
+    return max(0.0, int(reset) - time.time()) + 1
+
+
+@functools.lru_cache(maxsize=8)
+def _read_tweets_file(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Read a tweets file, returning one tweet per non-blank line.
+    
+    The file's modification time is part of the cache key, so an edited file
+    is parsed again while an unchanged one is served from memory.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = f.read()
+    
+    return tuple(line.strip() for line in data.split("\n") if line and not line.isspace())
+
 class TwitterAgent:
     """Twitter posting agent that posts tweets at regular intervals."""
     
-    def __init__(self, tweets_file: str = "tweets.txt"):
+    def __init__(self, tweets_file: str = "tweets.txt", env: Optional[Mapping[str, str]] = None):
         """
         Initialize the Twitter agent.
         
         Args:
             tweets_file: Path to the file containing tweets to post.
+            env: Settings to read instead of the process environment. When
+                omitted, .env is loaded and os.environ is used.
         """
-        # Load environment variables
-        load_dotenv()
+        # Load environment variables and read them from a single mapping
+        if env is None:
+            load_dotenv()
+            env = os.environ
         
         # Get Twitter API credentials
-        self.api_key = os.getenv("TWITTER_API_KEY")
-        self.api_secret = os.getenv("TWITTER_API_SECRET")
-        self.access_token = os.getenv("TWITTER_ACCESS_TOKEN")
-        self.access_token_secret = os.getenv("TWITTER_ACCESS_TOKEN_SECRET")
-        self.bearer_token = os.getenv("TWITTER_BEARER_TOKEN")
-        self.tweet_interval = int(os.getenv("TWEET_INTERVAL_MINUTES", "60"))
+        self.api_key = env.get("TWITTER_API_KEY")
+        self.api_secret = env.get("TWITTER_API_SECRET")
+        self.access_token = env.get("TWITTER_ACCESS_TOKEN")
+        self.access_token_secret = env.get("TWITTER_ACCESS_TOKEN_SECRET")
+        self.bearer_token = env.get("TWITTER_BEARER_TOKEN")
+        self.tweet_interval = int(env.get("TWEET_INTERVAL_MINUTES", "60"))
+        self.tweets_per_batch = max(1, int(env.get("TWEETS_PER_BATCH", "1")))
         
         # Get OpenAI API key
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
+        self.openai_api_key = env.get("OPENAI_API_KEY")
+        # The OpenAI client is created on first use, see _get_ai_client
         self.ai_client = None
-        if self.openai_api_key:
-            self.ai_client = OpenAI(api_key=self.openai_api_key)
-            logger.info("OpenAI client initialized")
-        else:
+        self._http = None
+        self._ai_client_lock = threading.Lock()
+        if not self.openai_api_key:
             logger.warning("OPENAI_API_KEY not found, AI tweet generation will not be available")
         
+        # Persistent cache of pre-generated AI tweets, created on first use, see _get_ai_cache
+        self._ai_cache = None
+        self._ai_cache_lock = threading.Lock()
+        
         # Check if credentials are provided
-        self._validate_credentials()
+        self._validate_credentials(env)
         
-        # Initialize Twitter API client
+        # Initialize Twitter API client; the v1.1 API is created on first use, see api_v1
         self.api = self._init_twitter_api()
+        self._api_v1 = None
+        self._api_v1_lock = threading.Lock()
+        # API method ("v2" or "v1") that last posted successfully; tried first next time
+        self._last_good_method = "v2"
         
         # Load tweets from file
         self.tweets_file = tweets_file
         self.tweets = self._load_tweets()
+        self._tweet_queue = deque(random.sample(self.tweets, len(self.tweets)))
+        self._last_tweet = None
         
         logger.info(f"TwitterAgent initialized with {len(self.tweets)} tweets")
     
-    def _validate_credentials(self) -> None:
-        """Validate that all required credentials are provided."""
-        missing = []
-        if not self.api_key:
-            missing.append("TWITTER_API_KEY")
-        if not self.api_secret:
-            missing.append("TWITTER_API_SECRET")
-        if not self.access_token:
-            missing.append("TWITTER_ACCESS_TOKEN")
-        if not self.access_token_secret:
-            missing.append("TWITTER_ACCESS_TOKEN_SECRET")
-        if not self.bearer_token:
-            missing.append("TWITTER_BEARER_TOKEN")
+    def __enter__(self) -> "TwitterAgent":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections held by the API clients."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+            self.ai_client = None
+        if self._ai_cache is not None:
+            self._ai_cache.close()
+            self._ai_cache = None
+        self.api.session.close()
+        if self._api_v1 is not None:
+            self._api_v1.session.close()
+            self._api_v1 = None
+    
+    def _validate_credentials(self, env: Mapping[str, str]) -> None:
+        """Validate that all required credentials are provided.
+        
+        Args:
+            env: Environment mapping the credentials were read from.
+        """
+        missing = [name for name in REQUIRED_CREDENTIALS if not env.get(name)]
             
         if missing:
             error_msg = f"Missing Twitter API credentials: {', '.join(missing)}"
             logger.error(error_msg)
             raise ValueError(error_msg)
             
+    def _get_ai_client(self):
+        """Return the OpenAI client, importing openai and creating it on first call."""
+        with self._ai_client_lock:
+            if self.ai_client is None:
+                import httpx
+                from openai import OpenAI
+                
+                # Reuse one pooled HTTP/2 client so each request skips the TLS handshake
+                self._http = httpx.Client(
+                    http2=True,
+                    timeout=30.0,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+                )
+                self.ai_client = OpenAI(api_key=self.openai_api_key, http_client=self._http)
+                logger.info("OpenAI client initialized")
+        
+        return self.ai_client
+    
+    def _get_ai_cache(self) -> Cache:
+        """Return the on-disk AI tweet cache, opening it on first call."""
+        with self._ai_cache_lock:
+            if self._ai_cache is None:
+                self._ai_cache = Cache(".ai_tweet_cache")
+        
+        return self._ai_cache
+    
     def _validate_ai_credentials(self) -> bool:
         """Validate that OpenAI API key is provided."""
         if not self.openai_api_key:
@@ -96,35 +329,47 @@ class TwitterAgent:
         return True
     
     def _init_twitter_api(self):
-        """Initialize and return both Twitter API clients (v1.1 and v2)."""
-        # Create OAuth 1.0a handler
-        auth = tweepy.OAuth1UserHandler(
-            consumer_key=self.api_key,
-            consumer_secret=self.api_secret,
-            access_token=self.access_token,
-            access_token_secret=self.access_token_secret
-        )
-        
-        # Create API v1.1 instance (for some endpoints that still work)
-        self.api_v1 = tweepy.API(auth)
-        
+        """Initialize and return the Twitter API v2 client."""
         # Create API v2 client
         client = tweepy.Client(
             bearer_token=self.bearer_token,
             consumer_key=self.api_key,
             consumer_secret=self.api_secret,
             access_token=self.access_token,
-            access_token_secret=self.access_token_secret,
-            wait_on_rate_limit=True
+            access_token_secret=self.access_token_secret
         )
+        self._mount_pooled_adapter(client.session)
         
         return client
     
+    @property
+    def api_v1(self) -> tweepy.API:
+        """Twitter API v1.1 instance, built on first use when posting falls back to it."""
+        # Locked because batch workers can all fall back to v1.1 at once
+        with self._api_v1_lock:
+            if self._api_v1 is None:
+                auth = tweepy.OAuth1UserHandler(
+                    consumer_key=self.api_key,
+                    consumer_secret=self.api_secret,
+                    access_token=self.access_token,
+                    access_token_secret=self.access_token_secret
+                )
+                
+                self._api_v1 = tweepy.API(auth)
+                self._mount_pooled_adapter(self._api_v1.session)
+        
+        return self._api_v1
+    
+    @staticmethod
+    def _mount_pooled_adapter(session) -> None:
+        """Keep Tweepy's HTTPS connections alive across requests, including batch posts."""
+        session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    
     def _load_tweets(self) -> List[str]:
         """Load tweets from the specified file."""
         try:
-            with open(self.tweets_file, "r") as f:
-                tweets = [line.strip() for line in f if line.strip()]
+            mtime_ns = os.stat(self.tweets_file).st_mtime_ns
+            tweets = list(_read_tweets_file(self.tweets_file, mtime_ns))
             
             if not tweets:
                 logger.warning(f"No tweets found in {self.tweets_file}")
@@ -134,85 +379,129 @@ class TwitterAgent:
             logger.error(f"Tweets file not found: {self.tweets_file}")
             raise
     
-    def post_tweet(self) -> None:
-        """Post a random tweet using the most compatible API method with rate limit handling."""
-        if not self.tweets:
-            logger.warning("No tweets available to post")
-            return
-        
-        # Select a random tweet
-        tweet = random.choice(self.tweets)
-        used_tweets = set()
-        used_tweets.add(tweet)
+    def _next_tweet(self) -> str:
+        """Return the next predefined tweet, reshuffling after each full cycle."""
+        if not self._tweet_queue:
+            self._tweet_queue.extend(random.sample(self.tweets, len(self.tweets)))
+            # Don't start the new cycle with the tweet that ended the last one
+            if len(self._tweet_queue) > 1 and self._tweet_queue[0] == self._last_tweet:
+                self._tweet_queue.rotate(-1)
+        self._last_tweet = self._tweet_queue.popleft()
+        return self._last_tweet
+    
+    def _next_tweets(self, count: int) -> List[str]:
+        """Return up to count different predefined tweets for one batch.
         
-        logger.info(f"Attempting to post tweet: {tweet}")
+        Tweets already chosen for the batch that come up again after a reshuffle
+        go back to the end of the queue, so a batch never repeats a tweet.
+        """
+        count = min(count, len(set(self.tweets)))
+        chosen, skipped = [], []
+        while len(chosen) < count:
+            tweet = self._next_tweet()
+            if tweet in chosen:
+                skipped.append(tweet)
+            else:
+                chosen.append(tweet)
         
-        # Initialize backoff parameters
-        max_retries = 5
-        initial_backoff = 60  # seconds
+        self._tweet_queue.extend(skipped)
+        return chosen
+    
+    def _try_v2(self, tweet: str) -> Optional[str]:
+        """Post a tweet with API v2 and return its ID, or None if no data came back."""
+        response = self.api.create_tweet(text=tweet)
+        if response and hasattr(response, 'data'):
+            return response.data['id']
+        return None
+    
+    def _try_v1(self, tweet: str) -> Optional[str]:
+        """Post a tweet with API v1.1 and return its ID."""
+        return self.api_v1.update_status(tweet).id
+    
+    def _post_with_fallback(self, tweet: str) -> Tuple[Optional[str], List[str]]:
+        """Post a tweet, starting with the API method that last succeeded.
         
-        for retry in range(max_retries + 1):
-            if retry > 0:
-                # Calculate exponential backoff with jitter
-                backoff_time = initial_backoff * (2 ** (retry - 1)) + random.uniform(0, 10)
-                logger.warning(f"Rate limit hit. Retry {retry}/{max_retries} after {backoff_time:.1f} seconds")
-                time.sleep(backoff_time)
-                
-                # Try a different tweet on retry to avoid duplicate errors
-                available_tweets = [t for t in self.tweets if t not in used_tweets]
-                if not available_tweets:
-                    # Reset if we've used all tweets
-                    used_tweets = set()
-                    available_tweets = self.tweets
-                
-                tweet = random.choice(available_tweets)
-                used_tweets.add(tweet)
-                logger.info(f"Retrying with new tweet: {tweet}")
+        Args:
+            tweet: Text of the tweet to post.
             
-            # Try multiple methods to post the tweet, starting with most likely to work
-            methods_tried = []
+        Returns:
+            The posted tweet ID (None if every method failed) and the methods tried.
             
-            # Method 1: Try API v2 with OAuth 1.0a
+        Raises:
+            tweepy.errors.TooManyRequests: If the method tried hit its rate limit.
+        """
+        methods = {
+            "v2": ("API v2 (OAuth 1.0a)", self._try_v2),
+            "v1": ("API v1.1 (OAuth 1.0a)", self._try_v1)
+        }
+        order = ("v2", "v1") if self._last_good_method == "v2" else ("v1", "v2")
+        
+        methods_tried = []
+        for key in order:
+            name, method = methods[key]
+            methods_tried.append(name)
             try:
-                methods_tried.append("API v2 (OAuth 1.0a)")
-                response = self.api.create_tweet(text=tweet)
-                
-                if response and hasattr(response, 'data'):
-                    tweet_id = response.data['id']
-                    logger.info(f"Successfully posted tweet with ID {tweet_id}: {tweet}")
-                    return
+                tweet_id = method(tweet)
             except tweepy.errors.TooManyRequests as e:
-                logger.warning(f"Rate limit exceeded: {e}")
-                # Continue to retry loop
-                continue
+                # Surface rate limits so the caller can wait for the reset on the event loop
+                logger.warning(f"{name} rate limit exceeded: {e}")
+                raise
             except Exception as e:
-                logger.warning(f"Method 1 failed: {e}")
+                logger.warning(f"{name} failed: {e}")
+                continue
             
-            # Method 2: Try API v1.1 with OAuth 1.0a
+            if tweet_id is not None:
+                self._last_good_method = key
+                return tweet_id, methods_tried
+        
+        return None, methods_tried
+    
+    async def _post_with_retry(self, tweet: str) -> Tuple[Optional[str], List[str]]:
+        """Post a tweet, waiting out rate limits on the event loop and retrying.
+        
+        The wait runs until the reset time Twitter reports, and stays cancellable
+        because it is an asyncio.sleep rather than a sleep inside Tweepy.
+        
+        Args:
+            tweet: Text of the tweet to post.
+            
+        Returns:
+            The posted tweet ID (None if every method failed) and the methods tried.
+        """
+        while True:
             try:
-                methods_tried.append("API v1.1 (OAuth 1.0a)")
-                status = self.api_v1.update_status(tweet)
-                logger.info(f"Successfully posted tweet with ID {status.id}: {tweet}")
-                return
+                return await _run_in_daemon_thread(self._post_with_fallback, tweet)
             except tweepy.errors.TooManyRequests as e:
-                logger.warning(f"Rate limit exceeded: {e}")
-                # Continue to retry loop
-                continue
-            except Exception as e:
-                logger.warning(f"Method 2 failed: {e}")
-            
-            # If both methods failed but not due to rate limits, no need to retry
-            if "TooManyRequests" not in str(e):
-                break
+                wait = _rate_limit_wait(e)
+                logger.warning(f"Rate limit hit. Retrying after {wait:.0f} seconds")
+                await asyncio.sleep(wait)
+    
+    async def post_tweet(self) -> None:
+        """Post a random tweet using the most compatible API method.
+        
+        Rate limits are waited out until the window resets, then the post is retried.
+        """
+        if not self.tweets:
+            logger.warning("No tweets available to post")
+            return
+        
+        # Take the next tweet from the shuffled queue
+        tweet = self._next_tweet()
+        
+        logger.info(f"Attempting to post tweet: {tweet}")
+        
+        tweet_id, methods_tried = await self._post_with_retry(tweet)
+        if tweet_id is not None:
+            logger.info(f"Successfully posted tweet with ID {tweet_id}: {tweet}")
+            return
         
-        # If we've reached here, all methods and retries failed
-        logger.error(f"Failed to post tweet after {max_retries} retries")
-        logger.error(f"Methods tried: {', '.join(methods_tried)}")
+        # If we've reached here, all methods failed
+        logger.error(f"Failed to post tweet using methods: {', '.join(methods_tried)}")
         logger.error("Your Twitter API access level may have insufficient permissions or rate limits.")
         logger.error("Recommended actions:")
         logger.error("1. Verify 'Read and write' permissions are enabled in developer portal")
         logger.error("2. Consider upgrading to Elevated API access or a paid tier")
-        logger.error("3. Increase the tweet interval (currently {self.tweet_interval} minutes)")
+        logger.error(f"3. Increase the tweet interval (currently {self.tweet_interval} minutes)")
         logger.error("4. Check Twitter's rate limit documentation for your tier: https://developer.twitter.com/en/docs/twitter-api/rate-limits")
     
     def generate_ai_tweet(self, topic: Optional[str] = None) -> str:
@@ -224,53 +513,71 @@ class TwitterAgent:
         Returns:
             AI-generated tweet text.
         """
-        if not self._validate_ai_credentials() or not self.ai_client:
+        if not self._validate_ai_credentials():
             logger.warning("OpenAI client not available. Using fallback tweet method.")
-            return random.choice(self.tweets)
+            return self._next_tweet()
+        
+        # Pre-generated tweets are consumed on read so the same text is never posted twice
+        cached = self._get_ai_cache().pop(self._ai_cache_key(topic), default=None)
+        if cached is not None:
+            logger.info(f"Using pre-generated AI tweet: {cached}")
+            return cached
             
         try:
-            # Default context about CryptoXpress
-            context = """
-            CryptoXpress is a cryptocurrency platform offering:
-            - Simplified crypto trading
-            - Decentralized finance (DeFi) solutions
-            - NFT marketplace
-            - Payment solutions
-            - Banking services
-            - Aims to make crypto accessible to regular users
-            - Available on web and mobile
-            - Focus on security and ease of use
-            - Website: https://www.cryptoxpress.com/
-            """
-            
-            topic_prompt = f"about {topic}" if topic else "about CryptoXpress services"
-            
-            # Use OpenAI to generate the tweet
-            response = self.ai_client.chat.completions.create(
-                model="gpt-3.5-turbo",  # Using 3.5 for cost efficiency, can use gpt-4 for higher quality
-                messages=[
-                    {"role": "system", "content": f"You are a marketing expert for a cryptocurrency platform called CryptoXpress. Generate ONE short, engaging tweet {topic_prompt}. The tweet must be under 280 characters, include relevant hashtags, and be written in a professional yet approachable tone. Do not use excessive emojis or hype language. Include the URL https://www.cryptoxpress.com/ only if it fits naturally. Context: {context}"},
-                    {"role": "user", "content": f"Write a single marketing tweet {topic_prompt}. Must be under 280 characters."}
-                ],
-                max_tokens=100,
-                temperature=0.7
-            )
-            
-            tweet_text = response.choices[0].message.content.strip()
-            logger.info(f"AI generated tweet: {tweet_text}")
-            
-            # Ensure the tweet is not too long
-            if len(tweet_text) > 280:
-                tweet_text = tweet_text[:277] + "..."
-                
-            return tweet_text
+            return self._request_ai_tweet(topic)
             
         except Exception as e:
             logger.error(f"Failed to generate AI tweet: {e}")
             # Fallback to random predefined tweet
-            return random.choice(self.tweets)
+            return self._next_tweet()
     
-    def post_ai_tweet(self, topic: Optional[str] = None) -> None:
+    def _request_ai_tweet(self, topic: Optional[str] = None) -> str:
+        """Request a new tweet from OpenAI, bypassing the cache."""
+        topic_prompt = f"about {topic}" if topic else "about CryptoXpress services"
+        
+        # Use OpenAI to generate the tweet
+        response = self._get_ai_client().chat.completions.create(
+            model="gpt-3.5-turbo",  # Using 3.5 for cost efficiency, can use gpt-4 for higher quality
+            messages=[
+                {"role": "system", "content": AI_SYSTEM_PROMPT.substitute(topic_prompt=topic_prompt)},
+                {"role": "user", "content": AI_USER_PROMPT.substitute(topic_prompt=topic_prompt)}
+            ],
+            max_tokens=100,
+            temperature=0.7
+        )
+        
+        tweet_text = response.choices[0].message.content.strip()
+        logger.info(f"AI generated tweet: {tweet_text}")
+        
+        # Ensure the tweet is not too long by Twitter's weighted count
+        return _fit_tweet_length(tweet_text)
+    
+    @staticmethod
+    def _ai_cache_key(topic: Optional[str], timestamp: Optional[float] = None) -> str:
+        """Build the AI tweet cache key for a topic in the hour containing timestamp."""
+        return f"{topic}:{time.strftime('%Y-%m-%d-%H', time.localtime(timestamp))}"
+    
+    def _prewarm_ai_tweet(self, topic: Optional[str], post_time: float) -> None:
+        """Generate and cache the tweet for a topic that will be posted at post_time.
+        
+        Args:
+            topic: Topic of the upcoming tweet.
+            post_time: Expected posting time as a Unix timestamp.
+        """
+        if not self.openai_api_key:
+            return
+        
+        cache = self._get_ai_cache()
+        key = self._ai_cache_key(topic, post_time)
+        if key in cache:
+            return
+        
+        try:
+            cache.set(key, self._request_ai_tweet(topic), expire=AI_CACHE_EXPIRE_SECONDS)
+        except Exception as e:
+            logger.warning(f"Failed to pre-generate AI tweet: {e}")
+    
+    async def post_ai_tweet(self, topic: Optional[str] = None) -> None:
         """Generate and post an AI-created tweet about CryptoXpress.
         
         Args:
@@ -279,37 +586,44 @@ class TwitterAgent:
         logger.info(f"Generating AI tweet{' about ' + topic if topic else ''}")
         
         # Generate the tweet
-        tweet = self.generate_ai_tweet(topic)
+        tweet = await _run_in_daemon_thread(self.generate_ai_tweet, topic)
         
         logger.info(f"Attempting to post AI-generated tweet: {tweet}")
         
-        # Try multiple methods to post the tweet, starting with most likely to work
-        methods_tried = []
-        
-        # Method 1: Try API v2 with OAuth 1.0a
-        try:
-            methods_tried.append("API v2 (OAuth 1.0a)")
-            response = self.api.create_tweet(text=tweet)
-            
-            if response and hasattr(response, 'data'):
-                tweet_id = response.data['id']
-                logger.info(f"Successfully posted AI tweet with ID {tweet_id}: {tweet}")
-                return
-        except Exception as e:
-            logger.warning(f"Method 1 failed: {e}")
-        
-        # Method 2: Try API v1.1 with OAuth 1.0a
-        try:
-            methods_tried.append("API v1.1 (OAuth 1.0a)")
-            status = self.api_v1.update_status(tweet)
-            logger.info(f"Successfully posted AI tweet with ID {status.id}: {tweet}")
+        tweet_id, methods_tried = await self._post_with_retry(tweet)
+        if tweet_id is not None:
+            logger.info(f"Successfully posted AI tweet with ID {tweet_id}: {tweet}")
             return
-        except Exception as e:
-            logger.warning(f"Method 2 failed: {e}")
         
         # If we've reached here, all methods failed
         logger.error(f"Failed to post AI tweet using methods: {', '.join(methods_tried)}")
     
+    async def post_tweets_batch(self, tweets: List[str]) -> None:
+        """Post several tweets concurrently, at most five at a time.
+        
+        Args:
+            tweets: Tweets to post.
+        """
+        if not tweets:
+            logger.warning("No tweets available to post")
+            return
+        
+        logger.info(f"Attempting to post batch of {len(tweets)} tweets")
+        
+        slots = asyncio.Semaphore(5)
+        
+        async def post_one(tweet: str) -> bool:
+            async with slots:
+                tweet_id, methods_tried = await self._post_with_retry(tweet)
+            if tweet_id is not None:
+                logger.info(f"Successfully posted tweet with ID {tweet_id}: {tweet}")
+                return True
+            logger.warning(f"Failed to post tweet in batch using methods: {', '.join(methods_tried)}")
+            return False
+        
+        results = await asyncio.gather(*(post_one(tweet) for tweet in tweets))
+        logger.info(f"Posted {sum(results)}/{len(tweets)} tweets in batch")
+    
     def run(self, use_ai: bool = False, ai_topics: List[str] = None) -> None:
         """Run the Twitter agent continuously.
         
@@ -319,6 +633,8 @@ class TwitterAgent:
         """
         logger.info(f"Starting Twitter agent, posting every {self.tweet_interval} minutes")
         logger.info(f"AI tweet generation: {'Enabled' if use_ai else 'Disabled'}")
+        if self.tweets_per_batch > 1:
+            logger.info(f"Posting {self.tweets_per_batch} tweets per interval")
         
         # Initialize topic rotation if AI is enabled
         if use_ai and ai_topics:
@@ -328,27 +644,58 @@ class TwitterAgent:
         else:
             self.ai_topics = None
         
-        # Define the function to run on schedule
-        def scheduled_post():
+        def next_topic() -> Optional[str]:
+            if not self.ai_topics:
+                return None
+            topic = self.ai_topics[self.current_topic_index]
+            self.current_topic_index = (self.current_topic_index + 1) % len(self.ai_topics)
+            return topic
+        
+        async def post_batch():
             if use_ai:
-                topic = None
-                if self.ai_topics:
-                    topic = self.ai_topics[self.current_topic_index]
-                    self.current_topic_index = (self.current_topic_index + 1) % len(self.ai_topics)
-                self.post_ai_tweet(topic)
+                tweets = await asyncio.gather(*(
+                    _run_in_daemon_thread(self.generate_ai_tweet, next_topic())
+                    for _ in range(self.tweets_per_batch)
+                ))
+            else:
+                tweets = self._next_tweets(self.tweets_per_batch)
+            await self.post_tweets_batch(list(tweets))
+        
+        # Define the coroutine to run on schedule; blocking API calls run in daemon threads
+        async def scheduled_post():
+            if self.tweets_per_batch > 1:
+                await post_batch()
+            elif use_ai and self.ai_topics:
+                topic = next_topic()
+                # Generate the next topic's tweet while this one is posting
+                post_time = time.time() + self.tweet_interval * 60
+                upcoming = self.ai_topics[self.current_topic_index]
+                await asyncio.gather(
+                    self.post_ai_tweet(topic),
+                    _run_in_daemon_thread(self._prewarm_ai_tweet, upcoming, post_time)
+                )
+            elif use_ai:
+                await self.post_ai_tweet()
             else:
-                self.post_tweet()
+                await self.post_tweet()
         
-        # Schedule the tweet posting
-        schedule.every(self.tweet_interval).minutes.do(scheduled_post)
+        # Post one tweet immediately on startup, then every interval
+        asyncio.run(self._tweet_loop(scheduled_post))
+    
+    async def _tweet_loop(self, scheduled_post: Callable[[], Awaitable[None]]) -> None:
+        """Post immediately, then once per tweet interval.
         
-        # Post one tweet immediately on startup
-        scheduled_post()
+        Ticks are measured from the start of each post, so they land at the
+        times the AI pre-generation predicts however long posting takes.
         
-        # Keep the script running
+        Args:
+            scheduled_post: Coroutine function that posts a single tweet.
+        """
+        loop = asyncio.get_running_loop()
         while True:
-            schedule.run_pending()
-            time.sleep(1)
+            start = loop.time()
+            await scheduled_post()
+            await asyncio.sleep(max(0.0, start + self.tweet_interval * 60 - loop.time()))
 
 
 if __name__ == "__main__":
@@ -356,27 +703,26 @@ if __name__ == "__main__":
         # Set a much longer interval between tweets to avoid Twitter's rate limits
         os.environ["TWEET_INTERVAL_MINUTES"] = "180"  # 3 hours between tweets
         
-        agent = TwitterAgent()
-        
-        # Define cryptocurrency-related topics to rotate through
-        crypto_topics = [
-            "cryptocurrency trading",
-            "DeFi solutions",
-            "NFT marketplace",
-            "secure crypto payments",
-            "crypto banking",
-            "mobile crypto app",
-            "blockchain technology",
-            "crypto for beginners",
-            "crypto security"
-        ]
-        
-        # For now, use regular tweets (not AI) to avoid complexity
-        # Leaving the AI code in place for future use when rate limits are resolved
-        agent.run(use_ai=True)
-        
-        # Uncomment to use AI tweets when rate limits are resolved:
-        # agent.run(use_ai=True, ai_topics=crypto_topics)
+        with TwitterAgent() as agent:
+            # Define cryptocurrency-related topics to rotate through
+            crypto_topics = [
+                "cryptocurrency trading",
+                "DeFi solutions",
+                "NFT marketplace",
+                "secure crypto payments",
+                "crypto banking",
+                "mobile crypto app",
+                "blockchain technology",
+                "crypto for beginners",
+                "crypto security"
+            ]
+            
+            # For now, use regular tweets (not AI) to avoid complexity
+            # Leaving the AI code in place for future use when rate limits are resolved
+            agent.run(use_ai=True)
+            
+            # Uncomment to use AI tweets when rate limits are resolved:
+            # agent.run(use_ai=True, ai_topics=crypto_topics)
     except KeyboardInterrupt:
         logger.info("Twitter agent stopped by user")
     except Exception as e: